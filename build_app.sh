@@ -54,7 +54,8 @@ echo -e "${GREEN}✓ 정리 완료${NC}"
 
 # 6. 앱 빌드
 echo -e "${YELLOW}[6/8] 앱 빌드 중...${NC}"
-python3 setup.py py2app --optimize=2
+# 빌드 옵션(optimize, strip, excludes 등)은 setup.py의 OPTIONS에서만 관리
+python3 setup.py py2app
 
 if [ ! -d "dist/MIDI Mixer Control.app" ]; then
     echo -e "${RED}✗ 빌드 실패!${NC}"
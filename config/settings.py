@@ -17,6 +17,9 @@ WINDOW_RESIZABLE: Tuple[bool, bool] = (False, True)
 # Logging
 LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
 LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+LOG_TO_FILE: bool = os.getenv("MIDI_LOG_TO_FILE", "0") == "1"
+LOG_FILE_MAX_BYTES: int = 5 * 2**20
+LOG_FILE_BACKUP_COUNT: int = 3
 
 # Threading
 MIDI_THREAD_DAEMON: bool = True
@@ -37,9 +40,16 @@ DEFAULT_QU5_PORT: int = 51325
 DEFAULT_QU5_CHANNEL: int = 1
 
 # Performance Settings
-MAX_MIDI_MESSAGES_PER_UPDATE: int = 100
-GUI_UPDATE_INTERVAL_MS: int = 10
+MAX_MIDI_MESSAGES_PER_UPDATE: int = 256
+GUI_UPDATE_INTERVAL_MS: int = 250  # Safety heartbeat; MIDI input is picked up by the wake poll
+GUI_WAKE_POLL_MS: int = 10  # How often the Tk thread checks the MIDI input flag (no Tcl work otherwise)
+LOG_FLUSH_INTERVAL_MS: int = 50
+LOG_BUFFER_MAX_LINES: int = 5000
+LOG_MAX_LINES: int = 2000
+LOG_TRIM_SLACK_LINES: int = 200  # Trim only after this many extra lines
+LOG_MAX_LINES_PER_FLUSH: int = 500
 PING_CACHE_INTERVAL_SEC: float = 3.0
+MESSAGE_REPEAT_WINDOW_SEC: float = 2.0  # Identical dialogs within this window are merged
 
 # Validation Settings
 VALID_MIXER_TYPES: Tuple[str, ...] = ("DM3", "Qu-5/6/7")
@@ -61,6 +71,9 @@ def get_config() -> Dict[str, Any]:
         "logging": {
             "level": LOG_LEVEL,
             "format": LOG_FORMAT,
+            "to_file": LOG_TO_FILE,
+            "file_max_bytes": LOG_FILE_MAX_BYTES,
+            "file_backup_count": LOG_FILE_BACKUP_COUNT,
         },
         "threading": {
             "midi_daemon": MIDI_THREAD_DAEMON,
@@ -77,6 +90,13 @@ def get_config() -> Dict[str, Any]:
         "performance": {
             "max_midi_messages": MAX_MIDI_MESSAGES_PER_UPDATE,
             "gui_update_interval": GUI_UPDATE_INTERVAL_MS,
+            "gui_wake_poll": GUI_WAKE_POLL_MS,
+            "log_flush_interval": LOG_FLUSH_INTERVAL_MS,
+            "log_buffer_max_lines": LOG_BUFFER_MAX_LINES,
+            "log_max_lines": LOG_MAX_LINES,
+            "log_trim_slack_lines": LOG_TRIM_SLACK_LINES,
+            "log_max_lines_per_flush": LOG_MAX_LINES_PER_FLUSH,
+            "message_repeat_window": MESSAGE_REPEAT_WINDOW_SEC,
             "ping_cache_interval": PING_CACHE_INTERVAL_SEC,
         },
     }
@@ -14,7 +14,7 @@ from model.qu5_midi_service import Qu5MIDIService
 from view.midi_view import MidiMixerView
 from config.settings import NOTE_ON_TYPE, NOTE_OFF_TYPE, PORT_WATCH_INTERVAL_SEC
 from utils.logger import get_logger
-from utils.prefs import load_prefs, save_prefs
+from utils.prefs import load_prefs, save_prefs_debounced
 
 
 class MidiController:
@@ -48,6 +48,9 @@ class MidiController:
         self._last_port_scan_time: float = 0.0
         self._port_scan_interval_sec: float = PORT_WATCH_INTERVAL_SEC
         
+        # In-memory preferences (loaded on first save, merged and saved in the background)
+        self._prefs: Optional[Dict[str, Any]] = None
+        
         # Background watcher
         self._port_watcher_thread: Optional[threading.Thread] = None
         self._port_watcher_stop = threading.Event()
@@ -57,7 +60,8 @@ class MidiController:
         self._setup_callbacks()
         
         # Set message handler for MIDI backend
-        self.midi_backend.set_message_handler(self._handle_midi_message)
+        self.midi_backend.set_message_handler(self._handle_midi_messages)
+        self.midi_backend.set_wake_callback(self.view.request_update)
         
         # Set up GUI update callback
         self.view.set_update_callback(self.update)
@@ -73,6 +77,7 @@ class MidiController:
         self.view.set_disconnect_callback(self._on_disconnect)
         self.view.set_refresh_ports_callback(self._on_refresh_ports)
         self.view.set_mixer_changed_callback(self._on_mixer_changed)
+        self.view.set_debug_midi_changed_callback(self._on_debug_midi_changed)
     
     def _on_connect(self) -> None:
         """Handle connection request from view."""
@@ -107,6 +112,9 @@ class MidiController:
                     self.view.clear_log()
                     self.view.append_log(f"🎉 {mixer} 믹서 연결 성공")
                     
+                    # Process any input that was queued before monitoring started
+                    self.view.request_update()
+                    
                     # 연결 성공 시 현재 설정 저장
                     self._save_current_settings()
                     
@@ -165,6 +173,26 @@ class MidiController:
             self.logger.error(f"믹서 변경 오류: {e}")
             self.view.show_message("오류", f"믹서 설정 변경 중 오류가 발생했습니다: {e}", "error")
     
+    def _on_qu5_connection_lost(self) -> None:
+        """Qu-5 sender thread lost the connection; handle it on the Tk thread."""
+        try:
+            self.view.root.after(0, self._handle_qu5_connection_lost)
+        except Exception as e:
+            self.logger.error(f"연결 끊김 처리 예약 실패: {e}")
+    
+    def _handle_qu5_connection_lost(self) -> None:
+        """Return the GUI to the disconnected state after the Qu-5 connection dropped."""
+        if not self.is_monitoring:
+            return  # Already disconnected by the user
+        
+        self._on_disconnect()
+        self.view.show_message("연결 끊김", "Qu-5 믹서와의 연결이 끊어졌습니다. 다시 연결해주세요.", "warning")
+    
+    def _on_debug_midi_changed(self, enabled: bool) -> None:
+        """Handle MIDI TX logging toggle from view."""
+        if self.qu5_service:
+            self.qu5_service.set_debug_midi(enabled)
+    
     def _initialize_services(self, mixer_name: str) -> None:
         """Initialize mixer services for selected mixer."""
         try:
@@ -183,6 +211,8 @@ class MidiController:
                 self.qu5_service = Qu5MIDIService(mixer_name, self.midi_backend)
                 # Set GUI callback for service logger
                 self.qu5_service.logger.set_gui_callback(self.view.append_log)
+                self.qu5_service.set_debug_midi(self.view.debug_midi_var.get())
+                self.qu5_service.set_connection_lost_callback(self._on_qu5_connection_lost)
                 # Set Qu-5 connection parameters from view
                 mixer_params = self.view.get_mixer_connection_params()
                 if mixer_params:
@@ -199,20 +229,29 @@ class MidiController:
             self.logger.error(f"서비스 초기화 오류: {e}")
             raise
     
-    def _handle_midi_message(self, message: mido.Message) -> None:
-        """Handle incoming MIDI message (called from MIDI thread)."""
+    def _handle_midi_messages(self, messages: List[mido.Message]) -> None:
+        """Handle a batch of incoming MIDI messages (called from main loop)."""
         try:
-            # Log incoming message
-            self.view.append_log(f"🎵 MIDI 수신: {message}")
-            
-            # Process note_on and note_off messages only
-            if message.type not in [NOTE_ON_TYPE, NOTE_OFF_TYPE]:
-                return
+            # Log the batch one line per message (the log limits count entries)
+            self.view.append_log_lines(f"🎵 MIDI 수신: {message}" for message in messages)
             
-            # Get mixer type and MIDI channel from view
+            # Get mixer type and MIDI channel from view once per batch
             params = self.view.get_connection_params()
             mixer = params["mixer"]
             mixer_midi_channel = params["midi_channel"]
+        except Exception as e:
+            self.logger.error(f"MIDI 메시지 처리 오류: {e}")
+            return
+        
+        for message in messages:
+            self._handle_midi_message(message, mixer, mixer_midi_channel)
+    
+    def _handle_midi_message(self, message: mido.Message, mixer: str, mixer_midi_channel: int) -> None:
+        """Route a single incoming MIDI message to the selected mixer service."""
+        try:
+            # Process note_on and note_off messages only
+            if message.type not in [NOTE_ON_TYPE, NOTE_OFF_TYPE]:
+                return
             
             # Route message based on channel and mixer type
             # Channel 0 = Soft key control, Channel 1 = Scene recall, Channel 2 = Mute control
@@ -245,13 +284,16 @@ class MidiController:
             self.logger.error(f"MIDI 메시지 처리 오류: {e}")
             self.view.append_log(f"메시지 처리 오류: {e}")
     
-    def update(self) -> None:
-        """Update controller state (called from main loop)."""
+    def update(self) -> bool:
+        """
+        Update controller state (called from main loop when MIDI input arrives).
+        Returns True if more queued messages remain.
+        """
         if self.is_monitoring:
             # Process queued MIDI messages
-            self.midi_backend.process_queued_messages()
-            return
+            return self.midi_backend.process_queued_messages()
         # Port polling moved to background watcher thread
+        return False
     
     def initialize(self) -> None:
         """Initialize the controller (without starting GUI main loop)."""
@@ -271,11 +313,8 @@ class MidiController:
                     self.view.update_virtual_port_status(self.midi_backend.virtual_port_name, False)
                     self.logger.warning("가상 MIDI 포트 생성 실패 - 시뮬레이션 모드로 실행")
                 
-                # 1) View 초기화 시점에서 이미 설정이 로드되므로 믹서 변경 콜백만 호출
-                # 믹서 타입이 로드된 경우 해당 믹서로 서비스 초기화
-                mixer = self.view.mixer_var.get()
-                if mixer in ["DM3", "Qu-5/6/7"]:
-                    self.view.root.after(100, lambda: self._on_mixer_changed(mixer))
+                # 1) 믹서 서비스 초기화는 View가 저장된 설정을 적용한 뒤
+                #    믹서 변경 콜백으로 요청함 (_apply_loaded_prefs)
 
                 # Initial port refresh must run on Tk main loop to avoid GIL issues
                 try:
@@ -333,10 +372,15 @@ class MidiController:
         self._port_watcher_stop.clear()
 
         def _watch():
+            last_active: Optional[bool] = None
             while not self._port_watcher_stop.is_set():
                 try:
-                    # For virtual ports, we only need to check if they're still active
-                    if not self.midi_backend.virtual_port_active:
+                    # For virtual ports, we only need to check if they're still active;
+                    # warn and touch the GUI only when the state actually changes
+                    active = self.midi_backend.virtual_port_active
+                    changed = active != last_active
+                    last_active = active
+                    if changed and not active:
                         self.logger.warning("가상 MIDI 포트가 비활성 상태로 변경됨")
                         # Update GUI to reflect inactive state
                         def _update_status():
@@ -367,7 +411,7 @@ class MidiController:
             
             # 믹서 타입 로드 및 적용
             mixer = prefs.get("mixer")
-            if isinstance(mixer, str) and mixer in ["DM3", "Qu-5/6/7"]:
+            if isinstance(mixer, str) and mixer in ("DM3", "Qu-5/6/7"):
                 self.view.mixer_var.set(mixer)
                 # 믹서 변경 콜백 호출하여 내부 서비스 구성을 업데이트
                 self._on_mixer_changed(mixer)
@@ -376,7 +420,7 @@ class MidiController:
             # MIDI 채널 로드 및 적용
             midi_channel = prefs.get("midi_channel")
             if isinstance(midi_channel, int) and 1 <= midi_channel <= 16:
-                self.view.midi_channel_var.set(str(midi_channel))
+                self.view.midi_channel_var.set(midi_channel)
                 self.logger.info(f"저장된 MIDI 채널 복원: {midi_channel}")
             
             # DM3 설정 로드 및 적용
@@ -385,7 +429,7 @@ class MidiController:
             if isinstance(dm3_ip, str) and dm3_ip:
                 self.view.dm3_ip_var.set(dm3_ip)
             if isinstance(dm3_port, int) and 1 <= dm3_port <= 65535:
-                self.view.dm3_port_var.set(str(dm3_port))
+                self.view.dm3_port_var.set(dm3_port)
             
             # Qu-5/6/7 설정 로드 및 적용
             qu5_ip = prefs.get("qu5_ip")
@@ -396,9 +440,9 @@ class MidiController:
             if isinstance(qu5_ip, str) and qu5_ip:
                 self.view.qu5_ip_var.set(qu5_ip)
             if isinstance(qu5_port, int) and 1 <= qu5_port <= 65535:
-                self.view.qu5_port_var.set(str(qu5_port))
+                self.view.qu5_port_var.set(qu5_port)
             if isinstance(qu5_channel, int) and 1 <= qu5_channel <= 16:
-                self.view.qu5_channel_var.set(str(qu5_channel))
+                self.view.qu5_channel_var.set(qu5_channel)
             if isinstance(use_tcp_midi, bool):
                 self.view.use_tcp_midi_var.set(use_tcp_midi)
             
@@ -412,7 +456,7 @@ class MidiController:
         try:
             # GUI에서 현재 설정값 가져오기
             mixer = self.view.mixer_var.get()
-            midi_channel = int(self.view.midi_channel_var.get())
+            midi_channel = self.view.midi_channel_var.get()
             
             # 믹서별 IP 주소와 포트 설정 가져오기
             mixer_params = self.view.get_mixer_connection_params()
@@ -436,10 +480,13 @@ class MidiController:
                     "use_tcp_midi": mixer_params.get("use_tcp_midi", True)
                 })
             
-            if save_prefs(prefs):
-                self.logger.info("연결 성공 시 설정 저장 완료")
-            else:
-                self.logger.warning("연결 성공 시 설정 저장 실패")
+            # Merge into the in-memory copy so the other mixer's settings are kept,
+            # and write on a background timer so the connect path doesn't block on disk
+            if self._prefs is None:
+                self._prefs = load_prefs()
+            self._prefs.update(prefs)
+            save_prefs_debounced(self._prefs)
+            self.logger.info("연결 성공 시 설정 저장 예약")
                 
         except Exception as e:
             self.logger.warning(f"연결 성공 시 설정 저장 중 경고: {e}")
@@ -8,7 +8,7 @@ from typing import Optional, List, Callable, Any, Union
 from queue import Queue, Empty
 import time
 
-from config.settings import MIDI_THREAD_DAEMON, MIDI_THREAD_TIMEOUT
+from config.settings import MIDI_THREAD_DAEMON, MIDI_THREAD_TIMEOUT, MAX_MIDI_MESSAGES_PER_UPDATE
 from utils.logger import get_logger
 
 # Try to import rtmidi, fallback to simulation if not available
@@ -75,14 +75,23 @@ class MidiBackend:
         self._midi_thread: Optional[threading.Thread] = None
         
         # Callback handlers
-        self._message_handler: Optional[Callable[[mido.Message], None]] = None
+        self._message_handler: Optional[Callable[[List[mido.Message]], None]] = None
+        self._wake_callback: Optional[Callable[[], None]] = None
         self._initialized = False
     
-    def set_message_handler(self, handler: Callable[[mido.Message], None]) -> None:
-        """Set the message handler callback (called from main thread)."""
+    def set_message_handler(self, handler: Callable[[List[mido.Message]], None]) -> None:
+        """Set the message handler callback (called from main thread with a batch of messages)."""
         with self._thread_lock:
             self._message_handler = handler
     
+    def set_wake_callback(self, callback: Callable[[], None]) -> None:
+        """
+        Set the callback invoked (from the MIDI thread) after a message is queued.
+        It must not block: the MIDI driver thread waits for it to return.
+        """
+        with self._thread_lock:
+            self._wake_callback = callback
+    
     def get_input_ports(self) -> List[str]:
         """Get available MIDI input ports (virtual port only)."""
         try:
@@ -239,6 +248,12 @@ class MidiBackend:
                 # MIDI 메시지 큐에 추가 (로그 제거)
             except Exception as queue_error:
                 self.logger.warning(f"메시지 큐 오류: {queue_error}, 메시지 건너뜀")
+                return
+            
+            # Ask the main thread to process the queue
+            wake = self._wake_callback
+            if wake:
+                wake()
                 
         except Exception as e:
             self.logger.error(f"가상 MIDI 콜백 오류: {e}")
@@ -278,25 +293,31 @@ class MidiBackend:
     # Virtual port doesn't need a separate listener loop
     # Messages are received via callback
     
-    def process_queued_messages(self) -> None:
-        """Process queued messages from main thread (called by controller)."""
+    def process_queued_messages(self) -> bool:
+        """
+        Process queued messages from main thread (called by controller).
+        Returns True if messages are still queued after this batch.
+        """
         if not self._message_handler:
-            return
-        
-        # Process all available messages (limit to prevent blocking)
-        max_messages = 100  # Process max 100 messages per call
-        processed = 0
+            return False
         
-        while processed < max_messages:
+        # Drain pending messages into one batch (limit to prevent blocking)
+        batch: List[mido.Message] = []
+        while len(batch) < MAX_MIDI_MESSAGES_PER_UPDATE:
             try:
-                message = self._message_queue.get_nowait()
-                self._message_handler(message)
-                processed += 1
+                batch.append(self._message_queue.get_nowait())
             except Empty:
                 break
-            except Exception as e:
-                self.logger.error(f"메시지 처리 오류: {e}")
-                break
+        
+        if not batch:
+            return False
+        
+        try:
+            self._message_handler(batch)
+        except Exception as e:
+            self.logger.error(f"메시지 처리 오류: {e}")
+        
+        return not self._message_queue.empty()
     
     def send_control_change(self, control: int, value: int, channel: int) -> bool:
         """Send Control Change message to virtual port."""
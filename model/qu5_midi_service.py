@@ -3,16 +3,21 @@ Qu-5/6/7 MIDI communication service.
 Handles MIDI communication with Qu-5/6/7 mixer via TCP/IP or USB MIDI.
 """
 import socket
+import struct
 import subprocess
 import platform
 import threading
 import time
 import mido
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, Tuple, Callable
 
 from model.base_service import BaseMidiService
 from utils.logger import get_logger
 
+# Three-byte channel voice message (status, data1, data2)
+_CC_STRUCT = struct.Struct("BBB")
+_CONTROL_CHANGE_STATUS = 0xB0
+
 
 class Qu5MIDIService(BaseMidiService):
     """
@@ -20,6 +25,16 @@ class Qu5MIDIService(BaseMidiService):
     Supports both TCP/IP MIDI and USB MIDI connections.
     """
     
+    # Soft key 1 maps to MIDI note 0x30 (48)
+    _SOFTKEY_NOTE_BASE = 0x30
+    
+    # NRPN controller numbers (parameter MSB, parameter LSB, data entry MSB, data entry LSB)
+    _NRPN_CONTROLS: Tuple[int, int, int, int] = (99, 98, 6, 38)
+    _NRPN_MUTE_MSB = 0x00
+    
+    # Socket timeout for sends after connect (keeps a dead mixer from stalling the sender)
+    _SEND_TIMEOUT_SEC = 0.5
+    
     def __init__(self, mixer_name: str, midi_backend):
         super().__init__()
         self.logger = get_logger(__name__)
@@ -34,12 +49,21 @@ class Qu5MIDIService(BaseMidiService):
         # Connection type
         self.use_tcp_midi = True  # TCP/IP MIDI vs USB MIDI
         
+        # Per-message TX logging (off by default; toggled from the GUI)
+        self._debug_midi = False
+        
         # Network connection
         self.qu5_socket: Optional[socket.socket] = None
         self.qu5_connected = False
         self._connection_lock = threading.RLock()
         self._last_ping_time = 0.0
         self._ping_interval = 3.0  # Ping every 3 seconds
+        
+        # TCP sender thread (drains self._message_queue of (bytes, delay) items)
+        self._sender_thread: Optional[threading.Thread] = None
+        
+        # Called (from the sender thread) when an established connection is lost
+        self._connection_lost_callback: Optional[Callable[[], None]] = None
     
     def set_connection_params(self, ip: str, port: int, channel: int, use_tcp: bool = True) -> None:
         """Set Qu-5 connection parameters."""
@@ -49,6 +73,25 @@ class Qu5MIDIService(BaseMidiService):
         self.use_tcp_midi = use_tcp
         self.logger.info(f"Qu-5 연결 설정: {ip}:{port}, 채널:{channel}, TCP/IP:{use_tcp}")
     
+    def set_connection_lost_callback(self, callback: Callable[[], None]) -> None:
+        """Set the callback invoked when a send fails and the connection is dropped."""
+        self._connection_lost_callback = callback
+    
+    def _mark_connection_lost(self) -> None:
+        """
+        Mark the service disconnected and notify once per connection.
+        Takes no lock: disconnect() joins the sender thread while holding _connection_lock.
+        """
+        was_connected = self.qu5_connected
+        self.qu5_connected = False
+        callback = self._connection_lost_callback
+        if was_connected and callback:
+            callback()
+    
+    def set_debug_midi(self, enabled: bool) -> None:
+        """Enable/disable logging of every transmitted MIDI message."""
+        self._debug_midi = enabled
+    
     def connect(self) -> bool:
         """Connect to Qu-5 mixer."""
         with self._connection_lock:
@@ -74,21 +117,17 @@ class Qu5MIDIService(BaseMidiService):
             if not self.ping_host(self.qu5_ip):
                 raise Exception(f"Ping 테스트 실패: {self.qu5_ip}")
             
-            # 2. TCP connection test
-            test_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            test_sock.settimeout(3)
-            result = test_sock.connect_ex((self.qu5_ip, self.qu5_port))
-            test_sock.close()
-            
-            if result != 0:
-                raise Exception(f"TCP 포트 연결 실패: {self.qu5_ip}:{self.qu5_port}")
+            # 2. Create TCP connection
+            try:
+                self.qu5_socket = socket.create_connection((self.qu5_ip, self.qu5_port), timeout=5)
+            except OSError as e:
+                raise Exception(f"TCP 포트 연결 실패: {self.qu5_ip}:{self.qu5_port} ({e})")
             
-            # 3. Create TCP socket
-            self.qu5_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.qu5_socket.settimeout(5)
-            self.qu5_socket.connect((self.qu5_ip, self.qu5_port))
+            # 3. Tune socket for small, latency-sensitive writes
+            self._configure_socket(self.qu5_socket)
             
             self.qu5_connected = True
+            self._start_sender()
             self.logger.info(f"🎉 Qu-5 TCP/IP MIDI 연결 성공: {self.qu5_ip}:{self.qu5_port}")
             return True
             
@@ -99,6 +138,26 @@ class Qu5MIDIService(BaseMidiService):
             self.qu5_connected = False
             raise e
     
+    def _configure_socket(self, sock: socket.socket) -> None:
+        """Set send timeout, TCP_NODELAY and keepalive so a vanished mixer is detected quickly."""
+        sock.settimeout(self._SEND_TIMEOUT_SEC)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        
+        # Keepalive timing (Linux: TCP_KEEPIDLE, macOS: TCP_KEEPALIVE)
+        keepidle = getattr(socket, "TCP_KEEPIDLE", None) or getattr(socket, "TCP_KEEPALIVE", None)
+        for option, value in (
+            (keepidle, 5),
+            (getattr(socket, "TCP_KEEPINTVL", None), 2),
+            (getattr(socket, "TCP_KEEPCNT", None), 3),
+        ):
+            if option is None:
+                continue
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, option, value)
+            except OSError:
+                pass  # Option not supported on this platform
+    
     def _connect_usb_midi(self) -> bool:
         """Connect to Qu-5 via USB MIDI (placeholder - would need mido output port)."""
         try:
@@ -117,6 +176,7 @@ class Qu5MIDIService(BaseMidiService):
     def disconnect(self) -> None:
         """Disconnect from Qu-5 mixer."""
         with self._connection_lock:
+            self._stop_sender()
             if self.qu5_socket:
                 try:
                     self.qu5_socket.close()
@@ -127,6 +187,56 @@ class Qu5MIDIService(BaseMidiService):
             self.qu5_connected = False
             self.logger.info("Qu-5 믹서 연결 해제됨")
     
+    def _start_sender(self) -> None:
+        """Start the TCP sender thread."""
+        if self._sender_thread and self._sender_thread.is_alive():
+            return
+        
+        self._sender_thread = threading.Thread(
+            target=self._sender_loop,
+            daemon=True,
+            name="Qu5Sender"
+        )
+        self._sender_thread.start()
+    
+    def _stop_sender(self) -> None:
+        """Stop the TCP sender thread after it flushes queued messages."""
+        if self._sender_thread and self._sender_thread.is_alive():
+            self._message_queue.put(None)  # Sentinel
+            self._sender_thread.join(timeout=2.0)
+        self._sender_thread = None
+    
+    def _sender_loop(self) -> None:
+        """
+        Write queued MIDI bytes to the Qu-5 socket.
+        Runs off the Tk thread; sendall() releases the GIL during the write.
+        """
+        while True:
+            item = self._message_queue.get()
+            if item is None:
+                break
+            
+            midi_bytes, delay = item
+            sock = self.qu5_socket
+            if sock is None or not self.qu5_connected:
+                continue
+            
+            try:
+                sock.sendall(midi_bytes)
+            except (BrokenPipeError, ConnectionResetError, socket.timeout) as e:
+                self.logger.error(f"🚨 Qu-5 연결이 끊어졌습니다: {e}")
+                self._mark_connection_lost()
+                continue
+            except Exception as e:
+                self.logger.error(f"❌ Qu-5 MIDI 전송 실패: {e}")
+                # Mark as disconnected on send failure
+                self._mark_connection_lost()
+                continue
+            
+            # Spacing between messages for proper sequencing on the mixer
+            if delay:
+                time.sleep(delay)
+    
     def ping_host(self, ip: str) -> bool:
         """Test host connectivity with ping (with caching)."""
         current_time = time.time()
@@ -153,36 +263,42 @@ class Qu5MIDIService(BaseMidiService):
             self.logger.error(f"Ping 테스트 예외: {e}")
             return False
     
-    def send_midi_message(self, message) -> bool:
-        """Send MIDI message to Qu-5."""
+    def send_midi_message(self, message, delay: float = 0.0) -> bool:
+        """Send mido MIDI message to Qu-5."""
+        description = f"type={message.type} ch={getattr(message, 'channel', 'n/a')}" if self._debug_midi else ""
+        return self.send_midi_bytes(bytes(message.bytes()), delay, description)
+    
+    def send_midi_bytes(self, midi_bytes: bytes, delay: float = 0.0, description: str = "") -> bool:
+        """
+        Send raw MIDI bytes to Qu-5.
+        TCP messages are queued for the sender thread, which waits ``delay``
+        seconds after writing before sending the next message.
+        Returns True once queued; a later write failure is reported through
+        the connection-lost callback.
+        """
         with self._connection_lock:
             if not self.qu5_connected:
                 self.logger.warning("⚠️ Qu-5에 연결되지 않음")
                 return False
             
             try:
-                # Prepare raw bytes and hex dump for logging
-                midi_bytes = bytes(message.bytes())
-                hex_dump = ' '.join(f"{b:02X}" for b in midi_bytes)
-                
                 if self.use_tcp_midi and self.qu5_socket:
-                    # TCP/IP MIDI transmission
-                    self.qu5_socket.send(midi_bytes)
-                    self.logger.info(
-                        f"➡️ [TX][TCP] type={message.type} ch={getattr(message, 'channel', 'n/a')} data=[{hex_dump}]"
-                    )
-                    return True
+                    # TCP/IP MIDI transmission (written by the sender thread)
+                    self._message_queue.put((midi_bytes, delay))
+                    transport = "TCP"
                 else:
                     # USB MIDI transmission would go here
-                    self.logger.info(
-                        f"➡️ [TX][USB] type={message.type} ch={getattr(message, 'channel', 'n/a')} data=[{hex_dump}]"
-                    )
-                    return True
+                    transport = "USB"
+                
+                if self._debug_midi:
+                    hex_dump = ' '.join(f"{b:02X}" for b in midi_bytes)
+                    self.logger.info(f"➡️ [TX][{transport}] {description} data=[{hex_dump}]")
+                return True
                     
             except Exception as e:
                 self.logger.error(f"❌ Qu-5 MIDI 전송 실패: {e}")
                 # Mark as disconnected on send failure
-                self.qu5_connected = False
+                self._mark_connection_lost()
                 return False
     
     def handle_mute(self, note: int, velocity: int, channel: int, mixer_midi_channel: int = None) -> None:
@@ -202,7 +318,7 @@ class Qu5MIDIService(BaseMidiService):
         channel_num = note + 1  # Convert to 1-based channel number
         mute_on_off = 1 if velocity >= 1 else 0
         
-        self.logger.info(f"🔇 Qu-5 뮤트 제어: 채널 {channel_num}, 뮤트: {mute_on_off}, MIDI 채널: {midi_channel}")
+        self.logger.info("🔇 Qu-5 뮤트 제어: 채널 %d, 뮤트: %d, MIDI 채널: %d", channel_num, mute_on_off, midi_channel)
         self.send_nrpn_mute_sequence(channel_num, mute_on_off, midi_channel)
     
     def handle_scene(self, note: int, channel: int, mixer_midi_channel: int = None) -> None:
@@ -220,7 +336,7 @@ class Qu5MIDIService(BaseMidiService):
             
         # Note 0 -> Scene 1, Note 1 -> Scene 2 ... (+1 offset required by mixer)
         scene_number = note + 1
-        self.logger.info(f"🎬 Qu-5 씬 리콜: {scene_number}번 씬, MIDI 채널: {midi_channel}")
+        self.logger.info("🎬 Qu-5 씬 리콜: %d번 씬, MIDI 채널: %d", scene_number, midi_channel)
         self.recall_scene_by_number(scene_number, midi_channel)
     
     def handle_softkey(self, note: int, channel: int, mixer_midi_channel: int = None) -> None:
@@ -238,7 +354,7 @@ class Qu5MIDIService(BaseMidiService):
             
         # Note 0-7 directly corresponds to soft key 0-7 (0-based)
         softkey_number = note  # Keep as 0-based for Qu-5
-        self.logger.info(f"🔘 Qu-5 소프트키 제어: {softkey_number}번 소프트키 (0-based), MIDI 채널: {midi_channel}")
+        self.logger.info("🔘 Qu-5 소프트키 제어: %d번 소프트키 (0-based), MIDI 채널: %d", softkey_number, midi_channel)
         self.send_softkey_command(softkey_number, midi_channel)
     
     def send_nrpn_mute_sequence(self, channel_num: int, mute_value: int, mixer_midi_channel: int = None) -> None:
@@ -248,7 +364,7 @@ class Qu5MIDIService(BaseMidiService):
             midi_channel = (mixer_midi_channel if mixer_midi_channel is not None else self.qu5_midi_channel) - 1  # Convert to 0-based MIDI channel
             
             self.logger.info(
-                f"🧩 NRPN 뮤트 시퀀스 시작: target_ch={channel_num} (midi_ch={midi_channel+1}), mute={mute_value}"
+                "🧩 NRPN 뮤트 시퀀스 시작: target_ch=%s (midi_ch=%s), mute=%s", channel_num, midi_channel + 1, mute_value
             )
             
             # Qu-5 NRPN mute sequence for specific channel:
@@ -257,23 +373,26 @@ class Qu5MIDIService(BaseMidiService):
             # CC 6 = 0 (Data Entry MSB) - Mute parameter
             # CC 38 = mute_value (1=mute, 0=unmute) - Mute value
             
-            sequence: List[Tuple[str, int, int, int]] = [
-                ('control_change', 99, 0, midi_channel),           # NRPN MSB = 0
-                ('control_change', 98, channel_num - 1, midi_channel),  # Channel number (0-based)
-                ('control_change', 6, 0, midi_channel),            # Data Entry MSB = 0
-                ('control_change', 38, mute_value, midi_channel)   # Mute value
-            ]
-            
-            for msg_type, control, value, ch in sequence:
-                msg = mido.Message(msg_type, channel=ch, control=control, value=value)
-                if not self.send_midi_message(msg):
+            values = (self._NRPN_MUTE_MSB, channel_num - 1, 0, mute_value)
+            # Reject out-of-range input instead of letting the masks below wrap it
+            # onto another channel or value (mido.Message raised ValueError here)
+            if not 0 <= midi_channel <= 0x0F or not all(0 <= value <= 0x7F for value in values):
+                self.logger.error(
+                    "❌ NRPN 값 범위 초과: target_ch=%s, midi_ch=%s, mute=%s", channel_num, midi_channel + 1, mute_value
+                )
+                return
+            status = _CONTROL_CHANGE_STATUS | midi_channel
+            description = f"type=control_change ch={midi_channel}" if self._debug_midi else ""
+            
+            for control, value in zip(self._NRPN_CONTROLS, values):
+                # Encode the CC directly; no mido.Message on this path
+                cc_bytes = _CC_STRUCT.pack(status, control, value)
+                # Small delay between messages for proper sequencing
+                if not self.send_midi_bytes(cc_bytes, delay=0.01, description=description):
                     self.logger.error(f"NRPN CC#{control} 전송 실패")
                     return
-                # Small delay between messages for proper sequencing
-                time.sleep(0.01)
             
-            action = "뮤트" if mute_value else "뮤트 해제"
-            self.logger.info(f"🔇 Qu-5 {channel_num}번 채널 {action} 완료")
+            self.logger.info("🔇 Qu-5 %s번 채널 %s 완료", channel_num, "뮤트" if mute_value else "뮤트 해제")
             
         except Exception as e:
             self.logger.error(f"❌ Qu-5 NRPN 뮤트 시퀀스 실패: {e}")
@@ -285,22 +404,21 @@ class Qu5MIDIService(BaseMidiService):
             midi_channel = (mixer_midi_channel if mixer_midi_channel is not None else self.qu5_midi_channel) - 1  # Convert to 0-based MIDI channel
             
             self.logger.info(
-                f"🔘 소프트키 트리거 시작: softkey_index={softkey_number} (0-based), midi_ch={midi_channel+1}"
+                "🔘 소프트키 트리거 시작: softkey_index=%s (0-based), midi_ch=%s", softkey_number, midi_channel + 1
             )
             
             # Qu-5 soft key control uses Note On/Off with notes starting at 0x30 for SoftKey 1
             # softkey_number is 0-based from input; compute MIDI note number:
-            midi_note = 0x30 + softkey_number
+            midi_note = self._SOFTKEY_NOTE_BASE + softkey_number
             
             note_on = mido.Message('note_on', channel=midi_channel, note=midi_note, velocity=127)
             note_off = mido.Message('note_off', channel=midi_channel, note=midi_note, velocity=0)
             
-            ok_on = self.send_midi_message(note_on)
-            time.sleep(0.02)
+            ok_on = self.send_midi_message(note_on, delay=0.02)
             ok_off = self.send_midi_message(note_off)
             
             if ok_on and ok_off:
-                self.logger.info(f"🔘 Qu-5 소프트키 트리거 완료: idx={softkey_number}, note=0x{midi_note:02X}")
+                self.logger.info("🔘 Qu-5 소프트키 트리거 완료: idx=%s, note=0x%02X", softkey_number, midi_note)
             else:
                 self.logger.error("❌ Qu-5 소프트키 Note On/Off 전송 실패")
             
@@ -314,13 +432,13 @@ class Qu5MIDIService(BaseMidiService):
             midi_channel = (mixer_midi_channel if mixer_midi_channel is not None else self.qu5_midi_channel) - 1  # Convert to 0-based MIDI channel
             
             self.logger.info(
-                f"🎬 씬 리콜 시작: scene={scene_number}, midi_ch={midi_channel+1} (Program Change)"
+                "🎬 씬 리콜 시작: scene=%s, midi_ch=%s (Program Change)", scene_number, midi_channel + 1
             )
             
             # Scene recall via Program Change: program is (scene_number - 1)
             program_msg = mido.Message('program_change', channel=midi_channel, program=max(0, scene_number - 1))
             if self.send_midi_message(program_msg):
-                self.logger.info(f"🎬 Qu-5 {scene_number}번 씬 리콜 완료 (PC={scene_number - 1})")
+                self.logger.info("🎬 Qu-5 %s번 씬 리콜 완료 (PC=%s)", scene_number, scene_number - 1)
             else:
                 self.logger.error("❌ Program Change 전송 실패")
             
@@ -1,12 +1,22 @@
 """
 Setup script for creating macOS .app bundle with py2app
 """
+import glob
+import os
+
 from setuptools import setup, find_packages
 
+# py2app is only installed on macOS build machines
+try:
+    from py2app.build_app import py2app as _py2app
+except ImportError:
+    _py2app = None
+
 APP = ['app.py']
 DATA_FILES = []
 
-# Optimized py2app options for better performance and smaller bundle size
+# Optimized py2app options for better performance and smaller bundle size.
+# This is the single source of truth for build options; build_app.sh does not override them.
 OPTIONS = {
     'argv_emulation': False,
     'packages': ['mido', 'rtmidi', 'tkinter', 'pythonosc', 'packaging'],
@@ -33,6 +43,10 @@ OPTIONS = {
         # Other unnecessary modules
         'http', 'html', 'setuptools', 'extern', 'vendor', 'helpers', 'distutils', 'wheel', 'pip', 'ensurepip', 'importlib_metadata', 'site', 'pkg_resources',
         'concurrent', 'asyncio',
+        # Unused standard library modules
+        'pydoc', 'doctest', 'pdb', 'xmlrpc', 'lib2to3', 'multiprocessing',
+        'xml.sax', 'xml.dom', 'lzma', 'bz2', 'decimal',
+        'idlelib', 'turtledemo', 'tkinter.test', 'pydoc_data', 'curses', 'dbm', 'readline', 'venv',
     ],
     'plist': {
         'CFBundleName': 'MIDI Mixer Control',
@@ -52,12 +66,42 @@ OPTIONS = {
     },
     'iconfile': None,  # 아이콘 파일이 있다면 경로 지정 (예: 'icon.icns')
     'resources': [],
+    'semi_standalone': False,  # 번들에 Python 프레임워크 포함
+    'site_packages': True,
     'optimize': 2,  # Python 최적화 레벨
     'strip': True,  # 디버그 심볼 제거
     'compressed': True,  # 압축된 번들 생성
     'dist_dir': 'dist',  # 배포 디렉토리
 }
 
+
+def _strip_compiled_sources(root: str) -> int:
+    """Remove .py files that have a sibling .pyc (sourceless import still works)."""
+    removed = 0
+    for dirpath, _dirnames, filenames in os.walk(root):
+        names = set(filenames)
+        for name in filenames:
+            if name.endswith('.py') and name + 'c' in names:
+                os.remove(os.path.join(dirpath, name))
+                removed += 1
+    return removed
+
+
+CMDCLASS = {}
+if _py2app is not None:
+    class StripSourcesPy2app(_py2app):
+        """py2app build that drops duplicate .py sources from the bundle afterwards."""
+        
+        def run(self):
+            super().run()
+            if self.alias:
+                return  # Alias builds symlink to the working tree; never touch sources
+            for lib_dir in glob.glob(os.path.join(self.dist_dir, '*.app', 'Contents', 'Resources', 'lib')):
+                removed = _strip_compiled_sources(lib_dir)
+                print(f"Removed {removed} .py files with compiled .pyc from {lib_dir}")
+    
+    CMDCLASS['py2app'] = StripSourcesPy2app
+
 setup(
     name='MIDI Mixer Control',
     version='1.0.1',
@@ -69,6 +113,7 @@ setup(
     data_files=DATA_FILES,
     packages=find_packages(),
     options={'py2app': OPTIONS},
+    cmdclass=CMDCLASS,
     setup_requires=['py2app>=0.13'],
     install_requires=[
         'mido>=1.2.10,<2.0.0',
@@ -1,104 +1,331 @@
 """
 Logging utilities with thread-safe considerations.
 """
+import atexit
 import logging
+import logging.handlers
 import threading
+import time
 import os
+from collections import deque
 from datetime import datetime
-from typing import Optional, Dict, Any
-from config.settings import LOG_LEVEL, LOG_FORMAT
+from typing import Optional, Dict, Any, List, Tuple, Deque, Callable, Mapping
+from config.settings import (
+    LOG_LEVEL, LOG_FORMAT, LOG_TO_FILE, LOG_FILE_MAX_BYTES, LOG_FILE_BACKUP_COUNT
+)
+
+# One log file per process (only opened when MIDI_LOG_TO_FILE=1)
+_LOG_FILE_PATH = os.path.join(
+    os.path.expanduser("~/Desktop"),
+    f"MIDI_Mixer_Control_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+)
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that reuses the date/time string for records within the same second.
+    Only the millisecond suffix is computed per record.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_sec = -1
+        self._cached_str = ""
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        
+        sec = int(record.created)
+        if sec != self._cached_sec:
+            self._cached_str = time.strftime(self.default_time_format, self.converter(sec))
+            self._cached_sec = sec
+        return self.default_msec_format % (self._cached_str, record.msecs)
+
+
+# Format string the fast path below is hard-coded for
+_FAST_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+class _FastFormatter(_CachedTimeFormatter):
+    """
+    Formatter specialized for ``_FAST_LOG_FORMAT``.
+    Builds the line directly instead of going through the generic style
+    substitution; records with traceback or stack text use the normal path.
+    """
+    
+    def format(self, record: logging.LogRecord) -> str:
+        # exc_info is already rendered into exc_text by _DeferredQueueHandler
+        if record.exc_text or record.stack_info:
+            return super().format(record)
+        
+        record.message = record.getMessage()
+        return f"{self.formatTime(record)} - {record.name} - {record.levelname} - {record.message}"
+
+
+def _create_handlers() -> List[logging.Handler]:
+    """Create the console and file handlers owned by the background listener."""
+    if LOG_FORMAT == _FAST_LOG_FORMAT:
+        formatter: logging.Formatter = _FastFormatter(LOG_FORMAT)
+    else:
+        formatter = _CachedTimeFormatter(LOG_FORMAT)
+    
+    # Console handler
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(formatter)
+    handlers: List[logging.Handler] = [console_handler]
+    
+    # File handler for debugging (opt-in, size-bounded)
+    if not LOG_TO_FILE:
+        return handlers
+    
+    try:
+        file_handler = logging.handlers.RotatingFileHandler(
+            _LOG_FILE_PATH, maxBytes=LOG_FILE_MAX_BYTES,
+            backupCount=LOG_FILE_BACKUP_COUNT, encoding='utf-8'
+        )
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
+        print(f"📝 로그 파일 생성: {_LOG_FILE_PATH}")
+    except Exception as e:
+        print(f"⚠️ 로그 파일 생성 실패: {e}")
+    
+    return handlers
+
+
+class RingLogQueue:
+    """
+    Bounded log record queue.
+    When full, the oldest record is dropped and counted so memory stays
+    bounded even if the log file stalls.
+    """
+    
+    def __init__(self, maxlen: int = 8192):
+        self._records: Deque[logging.LogRecord] = deque(maxlen=maxlen)
+        self._not_empty = threading.Condition(threading.Lock())
+        self._dropped = 0
+        self._closed = False
+    
+    def put_nowait(self, record: logging.LogRecord) -> None:
+        """Append a record, dropping the oldest one if the queue is full."""
+        with self._not_empty:
+            if len(self._records) == self._records.maxlen:
+                self._dropped += 1
+            self._records.append(record)
+            self._not_empty.notify()
+    
+    put = put_nowait
+    
+    def get_batch(self) -> Tuple[List[logging.LogRecord], int]:
+        """
+        Wait for records and return all of them with the number dropped since the last call.
+        Returns an empty batch only once the queue is closed and drained.
+        """
+        with self._not_empty:
+            while not self._records and not self._closed:
+                self._not_empty.wait()
+            batch = list(self._records)
+            self._records.clear()
+            dropped, self._dropped = self._dropped, 0
+        return batch, dropped
+    
+    def close(self) -> None:
+        """Wake the consumer so it can exit after draining."""
+        with self._not_empty:
+            self._closed = True
+            self._not_empty.notify_all()
+
+
+# Argument types that cannot change between the log call and the listener formatting them
+_IMMUTABLE_ARG_TYPES = frozenset((str, int, float, bool, bytes, type(None)))
+
+# Renders tracebacks in _DeferredQueueHandler.prepare() (only formatException is used)
+_TRACEBACK_FORMATTER = logging.Formatter()
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that leaves message formatting to the listener thread.
+    The stock prepare() merges msg % args on the caller; here that only
+    happens when an argument could be mutated before the listener runs.
+    Tracebacks are always rendered on the caller, while the frames exist.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.args and not (
+            isinstance(record.args, tuple)
+            and all(type(arg) in _IMMUTABLE_ARG_TYPES for arg in record.args)
+        ):
+            record.msg = record.getMessage()
+            record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _TRACEBACK_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class _BatchQueueListener(logging.handlers.QueueListener):
+    """
+    QueueListener that drains every pending record per wakeup and
+    writes each handler's output with a single write + flush.
+    """
+    
+    def enqueue_sentinel(self) -> None:
+        self.queue.close()
+    
+    def _monitor(self) -> None:
+        q = self.queue
+        while True:
+            batch, dropped = q.get_batch()
+            if not batch and not dropped:
+                break  # Closed and drained
+            
+            records = [self.prepare(record) for record in batch]
+            if dropped:
+                records.insert(0, logging.LogRecord(
+                    __name__, logging.WARNING, __file__, 0,
+                    "로그 버퍼 가득 참 - %d개 메시지 삭제됨", (dropped,), None
+                ))
+            self.handle_batch(records)
+    
+    def handle_batch(self, records: List[logging.LogRecord]) -> None:
+        """Format the batch per handler and write it in one call."""
+        for handler in self.handlers:
+            handler.acquire()
+            try:
+                lines = [
+                    handler.format(record) + handler.terminator
+                    for record in records
+                    if (not self.respect_handler_level or record.levelno >= handler.level)
+                    and handler.filter(record)
+                ]
+                if lines:
+                    data = "".join(lines)
+                    # The batch bypasses emit(), so check rotation here
+                    if (isinstance(handler, logging.handlers.RotatingFileHandler)
+                            and handler.maxBytes > 0
+                            and handler.stream.tell() + len(data) >= handler.maxBytes):
+                        handler.doRollover()
+                    handler.stream.write(data)
+                    handler.flush()
+            except Exception:
+                handler.handleError(records[-1])
+            finally:
+                handler.release()
+
+
+# Records are enqueued by callers and formatted/written by one background thread
+_log_queue = RingLogQueue()
+_listener = _BatchQueueListener(_log_queue, *_create_handlers(), respect_handler_level=True)
+_listener.start()
+atexit.register(_listener.stop)
 
 
 class ThreadSafeLogger:
     """
     Thread-safe logger wrapper to avoid GIL issues with logging.
+    Log calls only enqueue the record; I/O and, for plain arguments, message
+    formatting happen on the listener thread.
+    
+    Disabled levels return before any work. On hot paths pass arguments
+    lazily (``logger.info("val=%s", x)``) instead of an f-string so the
+    message is only built when the level is enabled.
     """
     
     def __init__(self, name: str, level: str = LOG_LEVEL):
         self._logger = logging.getLogger(name)
         self._logger.setLevel(getattr(logging, level.upper()))
-        self._lock = threading.RLock()  # Use RLock for better thread safety
-        self._initialized = False
         self._gui_callback = None  # GUI log callback
         
-        # Avoid duplicate handlers
-        if not self._logger.handlers:
-            # Console handler
-            console_handler = logging.StreamHandler()
-            formatter = logging.Formatter(LOG_FORMAT)
-            console_handler.setFormatter(formatter)
-            self._logger.addHandler(console_handler)
-            
-            # File handler for debugging
-            try:
-                log_dir = os.path.expanduser("~/Desktop")
-                log_file = os.path.join(log_dir, f"MIDI_Mixer_Control_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
-                file_handler = logging.FileHandler(log_file, mode='w', encoding='utf-8')
-                file_handler.setFormatter(formatter)
-                self._logger.addHandler(file_handler)
-                print(f"📝 로그 파일 생성: {log_file}")
-            except Exception as e:
-                print(f"⚠️ 로그 파일 생성 실패: {e}")
-            
-            self._initialized = True
+        # Don't walk up to the root logger's handlers; this also limits
+        # hasHandlers() to this logger's own handlers
+        self._logger.propagate = False
+        
+        # Avoid duplicate handlers (logging.Logger is shared per name)
+        if not self._logger.hasHandlers():
+            self._logger.addHandler(_DeferredQueueHandler(_log_queue))
     
-    def info(self, message: str) -> None:
-        if not self._initialized:
-            return
-        with self._lock:
-            self._logger.info(message)
-            self._send_to_gui(message)
+    def info(self, message: str, *args, **kwargs) -> None:
+        if self._logger.isEnabledFor(logging.INFO):
+            self._log(logging.INFO, message, args, kwargs)
     
-    def error(self, message: str) -> None:
-        if not self._initialized:
-            return
-        with self._lock:
-            self._logger.error(message)
-            self._send_to_gui(message)
+    def error(self, message: str, *args, **kwargs) -> None:
+        if self._logger.isEnabledFor(logging.ERROR):
+            self._log(logging.ERROR, message, args, kwargs)
     
-    def warning(self, message: str) -> None:
-        if not self._initialized:
-            return
-        with self._lock:
-            self._logger.warning(message)
-            self._send_to_gui(message)
+    def warning(self, message: str, *args, **kwargs) -> None:
+        if self._logger.isEnabledFor(logging.WARNING):
+            self._log(logging.WARNING, message, args, kwargs)
     
-    def debug(self, message: str) -> None:
-        if not self._initialized:
-            return
-        with self._lock:
-            self._logger.debug(message)
-            self._send_to_gui(message)
+    def debug(self, message: str, *args, **kwargs) -> None:
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._log(logging.DEBUG, message, args, kwargs)
     
-    def critical(self, message: str) -> None:
-        if not self._initialized:
-            return
-        with self._lock:
-            self._logger.critical(message)
-            self._send_to_gui(message)
+    def critical(self, message: str, *args, **kwargs) -> None:
+        if self._logger.isEnabledFor(logging.CRITICAL):
+            self._log(logging.CRITICAL, message, args, kwargs)
+    
+    def exception(self, message: str, *args, **kwargs) -> None:
+        if self._logger.isEnabledFor(logging.ERROR):
+            kwargs.setdefault("exc_info", True)
+            self._log(logging.ERROR, message, args, kwargs)
     
-    def exception(self, message: str) -> None:
-        if not self._initialized:
+    def _log(self, level: int, message: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> None:
+        """Emit the record and, if a GUI callback is set, send it the same text."""
+        # Single attribute read is atomic in CPython, so no lock is needed
+        # against a concurrent set_gui_callback()
+        cb = self._gui_callback
+        if cb is None:
+            # Formatting is deferred to the listener thread (see _DeferredQueueHandler)
+            self._logger.log(level, message, *args, **kwargs)
             return
-        with self._lock:
-            self._logger.exception(message)
-            self._send_to_gui(message)
+        
+        # Build the text once for both sinks, with the same rules as LogRecord.getMessage()
+        text = str(message)
+        if args:
+            fmt_args: Any = args
+            if len(args) == 1 and isinstance(args[0], Mapping) and args[0]:
+                fmt_args = args[0]
+            try:
+                text = text % fmt_args
+            except (TypeError, ValueError, KeyError):
+                # Let logging report the bad format string; show the raw text in the GUI
+                self._logger.log(level, message, *args, **kwargs)
+                self._send_to_gui(text, cb)
+                return
+        
+        self._logger.log(level, text, **kwargs)
+        self._send_to_gui(text, cb)
+    
+    def isEnabledFor(self, level: int) -> bool:
+        """Return True if a record at ``level`` would be emitted."""
+        return self._logger.isEnabledFor(level)
     
     def set_gui_callback(self, callback) -> None:
         """Set GUI callback for log messages."""
-        with self._lock:
-            self._gui_callback = callback
+        self._gui_callback = callback
     
-    def _send_to_gui(self, message: str) -> None:
-        """Send message to GUI if callback is set."""
-        if self._gui_callback:
-            try:
-                self._gui_callback(message)
-            except Exception:
-                # Ignore GUI callback errors to avoid breaking logging
-                pass
+    @staticmethod
+    def _send_to_gui(text: str, cb: Callable[[str], None]) -> None:
+        """Send an already formatted message to the GUI callback."""
+        try:
+            cb(text)
+        except Exception:
+            # Ignore GUI callback errors to avoid breaking logging
+            pass
+
+
+# One wrapper per logger name so GUI callbacks are shared by every caller
+_wrappers: Dict[str, ThreadSafeLogger] = {}
+_wrappers_lock = threading.Lock()
 
 
 def get_logger(name: str, level: str = LOG_LEVEL) -> ThreadSafeLogger:
-    """Get a thread-safe logger instance."""
-    return ThreadSafeLogger(name, level)
+    """Get the thread-safe logger wrapper for ``name`` (created on first use)."""
+    with _wrappers_lock:
+        wrapper = _wrappers.get(name)
+        if wrapper is None:
+            wrapper = ThreadSafeLogger(name, level)
+            _wrappers[name] = wrapper
+        return wrapper
@@ -2,15 +2,45 @@
 간단한 JSON 기반 환경설정 저장/로드 유틸리티.
 앱 재시작 시 마지막 선택값 복원을 위해 사용.
 """
+import atexit
 import json
 import os
 import threading
 from typing import Any, Dict, Optional
 
+# Use orjson when available (faster encode/decode), otherwise compact stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps(obj: Dict[str, Any]) -> bytes:
+    """dict -> UTF-8 JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    """UTF-8 JSON bytes -> object."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
 
 # Thread-safe file operations
 _file_lock = threading.RLock()
 
+# In-memory cache (re-read only when the file's mtime changes)
+_cache: Optional[Dict[str, Any]] = None
+_cache_mtime: float = 0.0
+
+# Pending debounced save
+_save_timer: Optional[threading.Timer] = None
+_pending_prefs: Optional[Dict[str, Any]] = None
+
 def _get_prefs_path() -> str:
     """사용자 홈 디렉터리 하위에 숨김 폴더를 만들고 그 안에 prefs.json 저장."""
     home = os.path.expanduser("~")
@@ -20,16 +50,21 @@ def _get_prefs_path() -> str:
 
 
 def load_prefs() -> Dict[str, Any]:
-    """환경설정 로드. 파일 없거나 손상 시 빈 dict 반환."""
+    """환경설정 로드. 파일 없거나 손상 시 빈 dict 반환. 파일이 바뀌지 않았으면 캐시 사용."""
+    global _cache, _cache_mtime
     with _file_lock:
         path = _get_prefs_path()
         try:
             if not os.path.exists(path):
                 return {}
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            mtime = os.stat(path).st_mtime
+            if _cache is not None and mtime == _cache_mtime:
+                return dict(_cache)
+            with open(path, "rb") as f:
+                data = _loads(f.read())
                 if isinstance(data, dict):
-                    return data
+                    _cache, _cache_mtime = data, mtime
+                    return dict(data)
                 return {}
         except Exception:
             # 손상/파싱 오류 시 안전하게 초기화
@@ -38,37 +73,51 @@ def load_prefs() -> Dict[str, Any]:
 
 def save_prefs(prefs: Dict[str, Any]) -> bool:
     """환경설정 저장. 성공 시 True."""
+    global _cache, _cache_mtime
     with _file_lock:
         path = _get_prefs_path()
+        tmp_path = path + ".tmp"
         try:
-            # Create backup of existing file
-            backup_path = path + ".backup"
-            if os.path.exists(path):
-                try:
-                    os.rename(path, backup_path)
-                except OSError:
-                    pass  # Ignore backup creation errors
-            
-            # Write new file
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(prefs, f, ensure_ascii=False, indent=2)
-            
-            # Remove backup if successful
-            if os.path.exists(backup_path):
-                try:
-                    os.remove(backup_path)
-                except OSError:
-                    pass  # Ignore backup removal errors
-            
+            # Write to a temp file in the same directory, then atomically replace
+            with open(tmp_path, "wb") as f:
+                f.write(_dumps(prefs))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+            _cache, _cache_mtime = dict(prefs), os.stat(path).st_mtime
             return True
         except Exception:
-            # Restore backup if write failed
-            backup_path = path + ".backup"
-            if os.path.exists(backup_path):
-                try:
-                    os.rename(backup_path, path)
-                except OSError:
-                    pass  # Ignore restore errors
+            # Leave the existing prefs.json untouched on failure
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass  # Ignore cleanup errors
             return False
 
 
+def save_prefs_debounced(prefs: Dict[str, Any], delay: float = 0.5) -> None:
+    """환경설정 지연 저장. delay 초 안에 다시 호출되면 마지막 값만 한 번 저장."""
+    global _save_timer, _pending_prefs
+    with _file_lock:
+        if _save_timer is not None:
+            _save_timer.cancel()
+        _pending_prefs = dict(prefs)
+        _save_timer = threading.Timer(delay, flush_pending_prefs)
+        _save_timer.daemon = True
+        _save_timer.start()
+
+
+def flush_pending_prefs() -> None:
+    """대기 중인 지연 저장을 즉시 디스크에 기록."""
+    global _save_timer, _pending_prefs
+    with _file_lock:
+        if _save_timer is not None:
+            _save_timer.cancel()
+            _save_timer = None
+        prefs, _pending_prefs = _pending_prefs, None
+        if prefs is not None:
+            save_prefs(prefs)
+
+
+# 앱 종료 시 대기 중인 저장 반영
+atexit.register(flush_pending_prefs)
@@ -3,20 +3,38 @@ Tkinter-based GUI for MIDI mixer control application.
 Thread-safe implementation with proper GUI thread handling.
 """
 import tkinter as tk
-from tkinter import ttk, messagebox
-from typing import List, Callable, Optional, Dict, Any, Union
+from tkinter import ttk
+from collections import deque
+from typing import List, Callable, Optional, Dict, Any, Union, Deque, Tuple, Iterable
 import threading
+import time
 
 from config.settings import (
     WINDOW_TITLE, WINDOW_SIZE, WINDOW_RESIZABLE, 
     DEFAULT_MIDI_CHANNEL, MIDI_CHANNEL_RANGE,
-    DEFAULT_DM3_IP, DEFAULT_DM3_PORT, DEFAULT_QU5_IP, DEFAULT_QU5_PORT
+    DEFAULT_DM3_IP, DEFAULT_DM3_PORT, DEFAULT_QU5_IP, DEFAULT_QU5_PORT, GUI_UPDATE_INTERVAL_MS, GUI_WAKE_POLL_MS,
+    LOG_FLUSH_INTERVAL_MS, LOG_BUFFER_MAX_LINES, LOG_MAX_LINES, LOG_MAX_LINES_PER_FLUSH,
+    LOG_TRIM_SLACK_LINES, MESSAGE_REPEAT_WINDOW_SEC
 )
-# Removed mixer_config dependency - we'll define mixers directly
 from utils.logger import get_logger
 from utils.prefs import load_prefs, save_prefs
 
 
+# Supported mixers are defined here directly (no mixer_config lookup at import).
+# Mixer name shown in the dropdown -> connection kind ("dm3" = OSC, "qu5" = TCP MIDI)
+_MIXER_KIND: Dict[str, str] = {
+    "DM3": "dm3",
+    "Qu-5/6/7": "qu5",
+}
+_SUPPORTED_MIXERS: Tuple[str, ...] = tuple(_MIXER_KIND)
+
+# Highest valid TCP/UDP port number
+_MAX_PORT = 65535
+
+# Widget types enabled/disabled with their frame (Labels are greyed out too)
+_STATEFUL_WIDGETS = (ttk.Entry, ttk.Checkbutton, ttk.Spinbox, ttk.Combobox, ttk.Button, ttk.Label)
+
+
 class MidiMixerView:
     """
     Main GUI view for MIDI mixer control.
@@ -26,6 +44,15 @@ class MidiMixerView:
     def __init__(self):
         self.logger = get_logger(__name__)
         
+        # The view is created on the Tk (main) thread
+        self._main_tid = threading.get_ident()
+        
+        # Read preferences in the background while the window is built;
+        # _apply_loaded_prefs picks them up once the main loop starts
+        self._loaded_prefs: Dict[str, Any] = {}
+        self._prefs_thread = threading.Thread(target=self._load_prefs_worker, daemon=True, name="PrefsLoader")
+        self._prefs_thread.start()
+        
         # Create main window
         self.root = tk.Tk()
         self.root.title(WINDOW_TITLE)
@@ -37,30 +64,58 @@ class MidiMixerView:
         self.on_disconnect_callback: Optional[Callable[[], None]] = None
         self.on_refresh_ports_callback: Optional[Callable[[], None]] = None
         self.on_mixer_changed_callback: Optional[Callable[[str], None]] = None
-        self.update_callback: Optional[Callable[[], None]] = None
-        
-        # GUI variables - load from preferences
-        prefs = load_prefs()
-        self.mixer_var = tk.StringVar(value=prefs.get("mixer", "DM3"))
+        self.on_debug_midi_changed_callback: Optional[Callable[[bool], None]] = None
+        self.update_callback: Optional[Callable[[], bool]] = None
+        
+        # GUI variables - defaults until saved preferences are applied
+        self.mixer_var = tk.StringVar(value=_SUPPORTED_MIXERS[0])
+        # Cached copy of mixer_var for hot-path reads (kept in sync by a write trace)
+        self._mixer_name = self.mixer_var.get()
+        self.mixer_var.trace_add("write", self._on_mixer_var_written)
         self.input_midi_var = tk.StringVar()
-        self.channel_var = tk.StringVar(value=str(DEFAULT_MIDI_CHANNEL))
+        self.channel_var = tk.IntVar(value=DEFAULT_MIDI_CHANNEL)
         self.output_midi_var = tk.StringVar()
         
         # MIDI channel for mixer control
-        self.midi_channel_var = tk.StringVar(value=str(prefs.get("midi_channel", 1)))
-        
-        # Mixer connection parameters - load from preferences
-        self.dm3_ip_var = tk.StringVar(value=prefs.get("dm3_ip", DEFAULT_DM3_IP))
-        self.dm3_port_var = tk.StringVar(value=str(prefs.get("dm3_port", DEFAULT_DM3_PORT)))
-        self.qu5_ip_var = tk.StringVar(value=prefs.get("qu5_ip", DEFAULT_QU5_IP))
-        self.qu5_port_var = tk.StringVar(value=str(prefs.get("qu5_port", DEFAULT_QU5_PORT)))
-        self.qu5_channel_var = tk.StringVar(value=str(prefs.get("qu5_channel", 1)))
-        self.use_tcp_midi_var = tk.BooleanVar(value=prefs.get("use_tcp_midi", True))
+        self.midi_channel_var = tk.IntVar(value=1)
+        
+        # Mixer connection parameters - defaults until saved preferences are applied
+        self.dm3_ip_var = tk.StringVar(value=DEFAULT_DM3_IP)
+        self.dm3_port_var = tk.IntVar(value=DEFAULT_DM3_PORT)
+        self.qu5_ip_var = tk.StringVar(value=DEFAULT_QU5_IP)
+        self.qu5_port_var = tk.IntVar(value=DEFAULT_QU5_PORT)
+        self.qu5_channel_var = tk.IntVar(value=1)
+        self.use_tcp_midi_var = tk.BooleanVar(value=True)
+        
+        # Per-message MIDI TX logging (off by default)
+        self.debug_midi_var = tk.BooleanVar(value=False)
+        
+        # Integer values cached on the Python side, refreshed only when the variable is written
+        self._channel_int = self._bind_int_cache(self.channel_var, "_channel_int", DEFAULT_MIDI_CHANNEL)
+        self._midi_channel_int = self._bind_int_cache(self.midi_channel_var, "_midi_channel_int", 1)
+        self._dm3_port_int = self._bind_int_cache(self.dm3_port_var, "_dm3_port_int", DEFAULT_DM3_PORT)
+        self._qu5_port_int = self._bind_int_cache(self.qu5_port_var, "_qu5_port_int", DEFAULT_QU5_PORT)
+        self._qu5_channel_int = self._bind_int_cache(self.qu5_channel_var, "_qu5_channel_int", 1)
         
         # Connection state
         self.is_connected = False
         self._initialized = False
         
+        # Pending newline-terminated log lines (appended from any thread, drained on the Tk thread)
+        self._log_buf: Deque[str] = deque(maxlen=LOG_BUFFER_MAX_LINES)
+        self._log_flush_scheduled = False
+        
+        # Last dialog shown, when it was last seen, and how many repeats were merged into it,
+        # and whether it is still open
+        self._last_message_sig: Optional[Tuple[str, str, str]] = None
+        self._last_message_time = 0.0
+        self._repeated_messages = 0
+        self._message_open = False
+        
+        # Set (from any thread) when MIDI input is waiting; checked by _poll_updates,
+        # so a burst of input costs one update
+        self._update_requested = False
+        
         # Control references for enabling/disabling
         self.mixer_dropdown = None
         self.connection_frame = None
@@ -73,6 +128,80 @@ class MidiMixerView:
         self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
         
         self._initialized = True
+        
+        # Apply saved preferences as the first main-loop event
+        self.root.after(0, self._apply_loaded_prefs)
+    
+    def _load_prefs_worker(self) -> None:
+        """Load preferences from disk (runs on the PrefsLoader thread)."""
+        self._loaded_prefs = load_prefs()
+    
+    def _apply_loaded_prefs(self) -> None:
+        """Copy loaded preferences into the GUI variables (runs on the Tk thread)."""
+        self._prefs_thread.join()
+        prefs = self._loaded_prefs
+        
+        # Values the entries would not accept keep their defaults
+        ignored = []
+        mixer = prefs.get("mixer")
+        if mixer in _MIXER_KIND:
+            self.mixer_var.set(mixer)
+        elif mixer is not None:
+            ignored.append("mixer")
+        for var, key, is_valid in (
+            (self.midi_channel_var, "midi_channel", self._is_valid_channel),
+            (self.dm3_port_var, "dm3_port", self._is_valid_port),
+            (self.qu5_port_var, "qu5_port", self._is_valid_port),
+            (self.qu5_channel_var, "qu5_channel", self._is_valid_channel),
+        ):
+            if key not in prefs:
+                continue
+            # Port 0 is rejected on connect, so it is not restored either
+            text = str(prefs[key])
+            if text not in ("", "0") and is_valid(text):
+                var.set(int(text))
+            else:
+                ignored.append(key)
+        for var, key in ((self.dm3_ip_var, "dm3_ip"), (self.qu5_ip_var, "qu5_ip")):
+            value = prefs.get(key)
+            if isinstance(value, str) and value.strip():
+                var.set(value)
+            elif key in prefs:
+                ignored.append(key)
+        use_tcp_midi = prefs.get("use_tcp_midi")
+        if isinstance(use_tcp_midi, bool):
+            self.use_tcp_midi_var.set(use_tcp_midi)
+        elif use_tcp_midi is not None:
+            ignored.append("use_tcp_midi")
+        if ignored:
+            self.logger.warning(f"⚠️ 잘못된 저장 설정 무시 (기본값 사용): {', '.join(ignored)}")
+        
+        # Show the matching settings frame and let the controller set up its services
+        self._on_mixer_selected(None)
+    
+    def _bind_int_cache(self, var: tk.IntVar, attr: str, default: int) -> int:
+        """Keep ``self.<attr>`` in sync with the integer value of ``var``; returns the initial value."""
+        var.trace_add("write", lambda *_: self._reparse_int(var, attr))
+        value = self._get_int(var)
+        return default if value is None else value
+    
+    def _on_mixer_var_written(self, *_) -> None:
+        """Refresh the cached mixer name after mixer_var changes."""
+        self._mixer_name = self.mixer_var.get()
+    
+    def _reparse_int(self, var: tk.IntVar, attr: str) -> None:
+        """Copy ``var`` into ``self.<attr>``, keeping the previous value while the field is blank."""
+        value = self._get_int(var)
+        if value is not None:
+            setattr(self, attr, value)
+    
+    @staticmethod
+    def _get_int(var: tk.IntVar) -> Optional[int]:
+        """Return the value of ``var``, or None if its entry is blank/invalid."""
+        try:
+            return var.get()
+        except tk.TclError:
+            return None
     
     def _create_widgets(self) -> None:
         """Create and layout all GUI widgets."""
@@ -85,20 +214,16 @@ class MidiMixerView:
         mixer_frame = ttk.LabelFrame(main_container, text="믹서 선택", padding="5")
         mixer_frame.pack(fill="x", pady=(0, 10))
         
-        self.mixer_dropdown = ttk.Combobox(mixer_frame, textvariable=self.mixer_var, state="readonly")
-        self.mixer_dropdown['values'] = ["DM3", "Qu-5/6/7"]
-        
-        # 저장된 믹서 타입에 따라 올바른 인덱스 선택
-        mixer_values = ["DM3", "Qu-5/6/7"]
-        current_mixer = self.mixer_var.get()
-        if current_mixer in mixer_values:
-            self.mixer_dropdown.current(mixer_values.index(current_mixer))
-        else:
-            self.mixer_dropdown.current(0)  # 기본값
+        self.mixer_dropdown = ttk.Combobox(mixer_frame, textvariable=self.mixer_var,
+                                           values=_SUPPORTED_MIXERS, state="readonly")
         
         self.mixer_dropdown.bind('<<ComboboxSelected>>', self._on_mixer_selected)
         self.mixer_dropdown.pack()
         
+        # Reject non-numeric / out-of-range keystrokes in numeric fields
+        port_vcmd = (self.root.register(self._is_valid_port), "%P")
+        channel_vcmd = (self.root.register(self._is_valid_channel), "%P")
+        
         # Mixer connection settings
         self.connection_frame = ttk.LabelFrame(main_container, text="믹서 연결 설정", padding="5")
         self.connection_frame.pack(fill="x", pady=(0, 10))
@@ -110,7 +235,8 @@ class MidiMixerView:
         ttk.Entry(self.dm3_frame, textvariable=self.dm3_ip_var, width=15).grid(row=0, column=1, padx=(0, 10))
         
         ttk.Label(self.dm3_frame, text="포트:").grid(row=0, column=2, sticky="w", padx=(0, 5))
-        ttk.Entry(self.dm3_frame, textvariable=self.dm3_port_var, width=10).grid(row=0, column=3)
+        ttk.Entry(self.dm3_frame, textvariable=self.dm3_port_var, width=10,
+                  validate="key", validatecommand=port_vcmd).grid(row=0, column=3)
         
         # Qu-5 settings (initially hidden)
         self.qu5_frame = ttk.Frame(self.connection_frame)
@@ -119,24 +245,33 @@ class MidiMixerView:
         ttk.Entry(self.qu5_frame, textvariable=self.qu5_ip_var, width=15).grid(row=0, column=1, padx=(0, 10))
         
         ttk.Label(self.qu5_frame, text="포트:").grid(row=0, column=2, sticky="w", padx=(0, 5))
-        ttk.Entry(self.qu5_frame, textvariable=self.qu5_port_var, width=10).grid(row=0, column=3, padx=(0, 10))
+        ttk.Entry(self.qu5_frame, textvariable=self.qu5_port_var, width=10,
+                  validate="key", validatecommand=port_vcmd).grid(row=0, column=3, padx=(0, 10))
         
         ttk.Label(self.qu5_frame, text="MIDI 채널:").grid(row=0, column=4, sticky="w", padx=(0, 5))
-        ttk.Entry(self.qu5_frame, textvariable=self.qu5_channel_var, width=5).grid(row=0, column=5, padx=(0, 10))
+        ttk.Entry(self.qu5_frame, textvariable=self.qu5_channel_var, width=5,
+                  validate="key", validatecommand=channel_vcmd).grid(row=0, column=5, padx=(0, 10))
         
         ttk.Checkbutton(self.qu5_frame, text="TCP/IP MIDI", variable=self.use_tcp_midi_var).grid(row=0, column=6)
         
+        # Widgets toggled on connect/disconnect (the frame contents never change)
+        self._connection_widgets = self._collect_stateful_widgets(self.connection_frame)
+        
         # MIDI Channel settings
         self.midi_channel_frame = ttk.LabelFrame(main_container, text="MIDI 채널 설정", padding="5")
         self.midi_channel_frame.pack(fill="x", pady=(0, 10))
         
         ttk.Label(self.midi_channel_frame, text="믹서 MIDI 채널:").grid(row=0, column=0, sticky="w", padx=(0, 5))
-        self.midi_channel_spinbox = ttk.Spinbox(self.midi_channel_frame, from_=1, to=16, textvariable=self.midi_channel_var, width=5)
+        self.midi_channel_spinbox = ttk.Spinbox(self.midi_channel_frame, from_=MIDI_CHANNEL_RANGE[0], to=MIDI_CHANNEL_RANGE[1], textvariable=self.midi_channel_var, width=5,
+                                                validate="key", validatecommand=channel_vcmd)
         self.midi_channel_spinbox.grid(row=0, column=1, padx=(0, 10))
         
         ttk.Label(self.midi_channel_frame, text="(1-16, 믹서로 전송되는 MIDI 메시지의 채널)", 
                  font=("TkDefaultFont", 8)).grid(row=0, column=2, sticky="w")
         
+        ttk.Checkbutton(self.midi_channel_frame, text="MIDI 전송 로그", variable=self.debug_midi_var,
+                        command=self._on_debug_midi_toggled).grid(row=1, column=0, columnspan=3, sticky="w")
+        
         # Control buttons
         button_frame = ttk.Frame(main_container)
         button_frame.pack(pady=(0, 10))
@@ -148,29 +283,35 @@ class MidiMixerView:
         log_frame = ttk.LabelFrame(main_container, text="로그", padding="5")
         log_frame.pack(fill="both", expand=True)
         
-        # Scrollbar for log
+        # Scrollbars for log (lines are not wrapped)
         scrollbar = ttk.Scrollbar(log_frame)
         scrollbar.pack(side="right", fill="y")
+        x_scrollbar = ttk.Scrollbar(log_frame, orient="horizontal")
+        x_scrollbar.pack(side="bottom", fill="x")
         
-        # Log text widget
-        self.log_text = tk.Text(log_frame, height=12, width=80, yscrollcommand=scrollbar.set)
+        # Log text widget (append-only: no undo stack, no wrap re-layout)
+        self.log_text = tk.Text(log_frame, height=12, width=80,
+                                yscrollcommand=scrollbar.set, xscrollcommand=x_scrollbar.set,
+                                undo=False, autoseparators=False, maxundo=0, wrap="none")
         self.log_text.pack(side="left", fill="both", expand=True)
         scrollbar.config(command=self.log_text.yview)
+        x_scrollbar.config(command=self.log_text.xview)
         
         # Initial mixer selection
         self._on_mixer_selected(None)
     
     def _on_mixer_selected(self, event) -> None:
         """Handle mixer selection change."""
-        mixer = self.mixer_var.get()
+        mixer = self._mixer_name
+        kind = _MIXER_KIND.get(mixer)
         
         # Show/hide appropriate connection settings
-        if mixer == "DM3":
+        if kind == "dm3":
             self.dm3_frame.pack(fill="x")
             self.qu5_frame.pack_forget()
             # DM3는 OSC를 사용하므로 MIDI 채널 설정 비활성화
             self._set_midi_channel_frame_state("disabled")
-        elif mixer == "Qu-5/6/7":
+        elif kind == "qu5":
             self.qu5_frame.pack(fill="x")
             self.dm3_frame.pack_forget()
             # Qu-5/6/7는 MIDI를 사용하므로 MIDI 채널 설정 활성화
@@ -179,6 +320,11 @@ class MidiMixerView:
         if self.on_mixer_changed_callback:
             self.on_mixer_changed_callback(mixer)
     
+    def _on_debug_midi_toggled(self) -> None:
+        """Handle MIDI TX logging checkbox change."""
+        if self.on_debug_midi_changed_callback:
+            self.on_debug_midi_changed_callback(self.debug_midi_var.get())
+    
     def _on_connect_toggle(self) -> None:
         """Handle connect/disconnect button click."""
         if self.is_connected:
@@ -200,34 +346,43 @@ class MidiMixerView:
         if self.on_disconnect_callback:
             self.on_disconnect_callback()
     
-    def _on_refresh_ports(self) -> None:
-        """Deprecated: no-op (refresh is automatic)."""
-        return
+    @staticmethod
+    def _is_plain_decimal(value: str) -> bool:
+        """
+        True for ASCII digits without a leading zero ("0" itself is allowed).
+        isdigit() also accepts e.g. "²", which int() rejects, and IntVar reads
+        through Tcl, which parses a leading zero as octal ("010" -> 8).
+        """
+        return value.isascii() and value.isdecimal() and (value[0] != "0" or len(value) == 1)
+    
+    @staticmethod
+    def _is_valid_port(value: str) -> bool:
+        """Entry validatecommand: allow empty (while editing) or 0-_MAX_PORT."""
+        return value == "" or (MidiMixerView._is_plain_decimal(value) and int(value) <= _MAX_PORT)
+    
+    @staticmethod
+    def _is_valid_channel(value: str) -> bool:
+        """Entry validatecommand: allow empty (while editing) or a channel in MIDI_CHANNEL_RANGE."""
+        return value == "" or (
+            MidiMixerView._is_plain_decimal(value)
+            and MIDI_CHANNEL_RANGE[0] <= int(value) <= MIDI_CHANNEL_RANGE[1]
+        )
     
     def _validate_connection_params(self) -> bool:
-        """Validate connection parameters."""
-        mixer = self.mixer_var.get()
+        """Validate connection parameters (digits/ranges are enforced while typing)."""
+        kind = _MIXER_KIND.get(self._mixer_name)
         
-        if mixer == "DM3":
-            # Validate DM3 connection parameters
-            try:
-                ip = self.dm3_ip_var.get().strip()
-                port = int(self.dm3_port_var.get().strip())
-                if not ip or port <= 0 or port > 65535:
-                    raise ValueError()
-            except (ValueError, AttributeError):
+        if kind == "dm3":
+            # Only empty fields or port 0 can get past the entry validators
+            if not self.dm3_ip_var.get().strip() or not self._get_int(self.dm3_port_var):
+                from tkinter import messagebox  # Loaded on first use to keep startup light
                 messagebox.showerror("입력 오류", "DM3 IP 주소와 포트를 올바르게 입력해주세요.")
                 return False
         
-        elif mixer == "Qu-5/6/7":
-            # Validate Qu-5/6/7 connection parameters
-            try:
-                ip = self.qu5_ip_var.get().strip()
-                port = int(self.qu5_port_var.get().strip())
-                channel = int(self.qu5_channel_var.get().strip())
-                if not ip or port <= 0 or port > 65535 or channel < 1 or channel > 16:
-                    raise ValueError()
-            except (ValueError, AttributeError):
+        elif kind == "qu5":
+            if (not self.qu5_ip_var.get().strip() or not self._get_int(self.qu5_port_var)
+                    or not self._get_int(self.qu5_channel_var)):
+                from tkinter import messagebox  # Loaded on first use to keep startup light
                 messagebox.showerror("입력 오류", "Qu-5/6/7 IP 주소, 포트, MIDI 채널을 올바르게 입력해주세요.")
                 return False
         
@@ -236,14 +391,8 @@ class MidiMixerView:
     
     def _set_connection_frame_state(self, state: str) -> None:
         """Enable/disable all widgets in connection frame."""
-        if state == "disabled":
-            # Disable all entry widgets and checkbuttons in connection frames
-            for widget in self.connection_frame.winfo_children():
-                self._set_widget_state_recursive(widget, state)
-        else:
-            # Enable all widgets in connection frames
-            for widget in self.connection_frame.winfo_children():
-                self._set_widget_state_recursive(widget, state)
+        for widget in self._connection_widgets:
+            widget.config(state=state)
     
     def _set_midi_channel_frame_state(self, state: str) -> None:
         """Enable/disable all widgets in MIDI channel frame."""
@@ -254,23 +403,14 @@ class MidiMixerView:
             # Enable spinbox
             self.midi_channel_spinbox.config(state=state)
     
-    def _set_widget_state_recursive(self, widget, state: str) -> None:
-        """Recursively set widget state for nested widgets."""
-        try:
-            if hasattr(widget, 'config'):
-                # Check if widget has state config
-                try:
-                    widget.config(state=state)
-                except tk.TclError:
-                    # Widget doesn't support state config, skip
-                    pass
-            
-            # Recursively apply to children
-            for child in widget.winfo_children():
-                self._set_widget_state_recursive(child, state)
-        except tk.TclError:
-            # Widget might be destroyed, ignore
-            pass
+    def _collect_stateful_widgets(self, parent: tk.Misc) -> List[tk.Misc]:
+        """Return every stateful descendant of ``parent`` (walked once)."""
+        widgets: List[tk.Misc] = []
+        for child in parent.winfo_children():
+            if isinstance(child, _STATEFUL_WIDGETS):
+                widgets.append(child)
+            widgets.extend(self._collect_stateful_widgets(child))
+        return widgets
     
     def _on_closing(self) -> None:
         """Handle window closing."""
@@ -298,19 +438,13 @@ class MidiMixerView:
         """Set mixer changed callback function."""
         self.on_mixer_changed_callback = callback
     
-    def set_update_callback(self, callback: Callable[[], None]) -> None:
-        """Set update callback function."""
-        self.update_callback = callback
+    def set_debug_midi_changed_callback(self, callback: Callable[[bool], None]) -> None:
+        """Set MIDI TX logging toggle callback function."""
+        self.on_debug_midi_changed_callback = callback
     
-    def update_input_ports(self, ports: List[str]) -> None:
-        """Update input port dropdown options (deprecated - virtual ports only)."""
-        # Virtual ports are handled automatically, no need to update dropdowns
-        pass
-    
-    def update_output_ports(self, ports: List[str]) -> None:
-        """Update output port dropdown options (deprecated - virtual ports only)."""
-        # Virtual ports are handled automatically, no need to update dropdowns
-        pass
+    def set_update_callback(self, callback: Callable[[], bool]) -> None:
+        """Set update callback function (returns True if more work is pending)."""
+        self.update_callback = callback
     
     def set_connection_state(self, connected: bool) -> None:
         """Update connection state and button text."""
@@ -328,34 +462,80 @@ class MidiMixerView:
             self.mixer_dropdown.config(state="normal")
             self._set_connection_frame_state("normal")
             # MIDI 채널 설정은 믹서 타입에 따라 활성화/비활성화
-            mixer = self.mixer_var.get()
-            if mixer == "DM3":
+            if _MIXER_KIND.get(self._mixer_name) == "dm3":
                 self._set_midi_channel_frame_state("disabled")
             else:  # Qu-5/6/7
                 self._set_midi_channel_frame_state("normal")
     
     def clear_log(self) -> None:
         """Clear the log text area."""
+        self._log_buf.clear()
         self.log_text.delete(1.0, tk.END)
     
     def append_log(self, message: str) -> None:
-        """Append message to log (thread-safe)."""
+        """
+        Append message to log (thread-safe; shown on the next flush).
+        The newline is added here on the calling thread, so the flush only joins
+        and inserts. ``message`` should be one line: the buffer and per-flush
+        limits count entries.
+        """
         if not self._initialized:
             return
-            
-        def _append():
+        self._log_buf.append(message + "\n")
+        if not self._log_flush_scheduled:
+            self._schedule_log_flush()
+    
+    def append_log_lines(self, messages: Iterable[str]) -> None:
+        """Append several one-line messages to the log with a single flush check."""
+        if not self._initialized:
+            return
+        self._log_buf.extend(message + "\n" for message in messages)
+        if not self._log_flush_scheduled:
+            self._schedule_log_flush()
+    
+    def _schedule_log_flush(self) -> None:
+        """Arm one flush timer; lines appended before it fires share the flush."""
+        self._log_flush_scheduled = True
+        try:
+            self.root.after(LOG_FLUSH_INTERVAL_MS, self._drain_log)
+        except (tk.TclError, RuntimeError):
+            # Main loop not running or window destroyed
+            self._log_flush_scheduled = False
+    
+    def _drain_log(self) -> None:
+        """Insert pending log lines with a single Text update (runs on Tk thread)."""
+        if not self._initialized:
+            return
+        
+        lines = []
+        try:
+            while len(lines) < LOG_MAX_LINES_PER_FLUSH:
+                lines.append(self._log_buf.popleft())
+        except IndexError:
+            pass
+        
+        if lines:
             try:
-                self.log_text.insert(tk.END, f"{message}\n")
-                self.log_text.see(tk.END)
+                # Only auto-scroll if the user is already viewing the end of the log
+                follow_tail = self.log_text.yview()[1] >= 0.999
+                self.log_text.insert(tk.END, "".join(lines))
+                
+                # Keep only the last LOG_MAX_LINES lines; the slack lets one
+                # delete cover many flushes instead of trimming on every flush
+                line_count = int(self.log_text.index("end-1c").split(".")[0])
+                if line_count > LOG_MAX_LINES + LOG_TRIM_SLACK_LINES:
+                    self.log_text.delete("1.0", f"{line_count - LOG_MAX_LINES}.0")
+                
+                if follow_tail:
+                    self.log_text.see(tk.END)
             except tk.TclError:
                 # Widget might be destroyed
-                pass
+                return
         
-        # Ensure GUI updates happen on main thread
-        if threading.current_thread() == threading.main_thread():
-            _append()
-        else:
-            self.root.after(0, _append)
+        # Clear the flag before checking so a concurrent append re-arms the timer
+        self._log_flush_scheduled = False
+        if self._log_buf:
+            self._schedule_log_flush()
     
     def show_message(self, title: str, message: str, msg_type: str = "info") -> None:
         """Show message dialog (thread-safe)."""
@@ -363,19 +543,44 @@ class MidiMixerView:
             return
             
         def _show():
+            from tkinter import messagebox  # Loaded on first use to keep startup light
+            
+            # Merge repeats of the same dialog: all of them while it is open,
+            # and those arriving within the window after it was closed
+            sig = (msg_type, title, message)
+            now = time.monotonic()
+            if sig == self._last_message_sig and (
+                self._message_open or now - self._last_message_time < MESSAGE_REPEAT_WINDOW_SEC
+            ):
+                self._repeated_messages += 1
+                self._last_message_time = now
+                return
+            
+            text = message
+            if sig == self._last_message_sig and self._repeated_messages:
+                text = f"{message} (×{self._repeated_messages + 1})"
+            self._last_message_sig = sig
+            self._last_message_time = now
+            self._repeated_messages = 0
+            
+            self._message_open = True
             try:
                 if msg_type == "error":
-                    messagebox.showerror(title, message)
+                    messagebox.showerror(title, text)
                 elif msg_type == "warning":
-                    messagebox.showwarning(title, message)
+                    messagebox.showwarning(title, text)
                 else:
-                    messagebox.showinfo(title, message)
+                    messagebox.showinfo(title, text)
             except tk.TclError:
                 # Widget might be destroyed
                 pass
+            finally:
+                # Restart the window when the dialog closes
+                self._message_open = False
+                self._last_message_time = time.monotonic()
         
         # Ensure dialogs appear on main thread
-        if threading.current_thread() == threading.main_thread():
+        if threading.get_ident() == self._main_tid:
             _show()
         else:
             self.root.after(0, _show)
@@ -383,27 +588,27 @@ class MidiMixerView:
     def get_connection_params(self) -> Dict[str, Any]:
         """Get current connection parameters."""
         return {
-            "mixer": self.mixer_var.get(),
+            "mixer": self._mixer_name,
             "input_port": self.input_midi_var.get(),
             "output_port": self.output_midi_var.get(),
-            "channel": int(self.channel_var.get()),
-            "midi_channel": int(self.midi_channel_var.get())
+            "channel": self._channel_int,
+            "midi_channel": self._midi_channel_int
         }
     
     def get_mixer_connection_params(self) -> Dict[str, Any]:
         """Get mixer-specific connection parameters."""
-        mixer = self.mixer_var.get()
+        kind = _MIXER_KIND.get(self._mixer_name)
         
-        if mixer == "DM3":
+        if kind == "dm3":
             return {
                 "dm3_ip": self.dm3_ip_var.get(),
-                "dm3_port": int(self.dm3_port_var.get())
+                "dm3_port": self._dm3_port_int
             }
-        elif mixer == "Qu-5/6/7":
+        elif kind == "qu5":
             return {
                 "qu5_ip": self.qu5_ip_var.get(),
-                "qu5_port": int(self.qu5_port_var.get()),
-                "qu5_channel": int(self.qu5_channel_var.get()),
+                "qu5_port": self._qu5_port_int,
+                "qu5_channel": self._qu5_channel_int,
                 "use_tcp_midi": self.use_tcp_midi_var.get()
             }
         
@@ -418,26 +623,56 @@ class MidiMixerView:
         """Start the GUI main loop."""
         self.logger.info("GUI 시작")
         
-        # Set up update loop for MIDI message processing
-        self._schedule_update()
+        # Pick up flagged MIDI input, plus a low-rate safety net
+        self.root.after(GUI_WAKE_POLL_MS, self._poll_updates)
+        self.root.after(GUI_UPDATE_INTERVAL_MS, self._heartbeat)
         
         # Start Tkinter main loop
         self.root.mainloop()
     
-    def _schedule_update(self) -> None:
-        """Schedule periodic updates for MIDI message processing."""
+    def request_update(self) -> None:
+        """
+        Request an update on the next wake poll (safe to call from any thread).
+        Only sets a flag: a Tk call from the MIDI thread would block it until
+        the Tk thread is free, and raises before the main loop is running.
+        """
+        self._update_requested = True
+    
+    def _poll_updates(self) -> None:
+        """Run the update callback if MIDI input was flagged since the last poll."""
         if not self._initialized:
             return
-            
-        # Call controller update if available
-        if self.update_callback:
-            try:
-                self.update_callback()
-            except Exception as e:
-                self.logger.error(f"업데이트 콜백 오류: {e}")
         
-        # Schedule next update
-        self.root.after(10, self._schedule_update)  # 10ms interval
+        if self._update_requested:
+            self._run_update()
+        
+        self.root.after(GUI_WAKE_POLL_MS, self._poll_updates)
+    
+    def _run_update(self) -> None:
+        """Run the controller update for pending MIDI input."""
+        # Clear first so input arriving during the callback is picked up by the next poll
+        self._update_requested = False
+        if not self._initialized or not self.update_callback:
+            return
+        
+        try:
+            more_pending = self.update_callback()
+        except Exception as e:
+            self.logger.error(f"업데이트 콜백 오류: {e}")
+            return
+        
+        if more_pending:
+            self.request_update()
+    
+    def _heartbeat(self) -> None:
+        """Run the update callback periodically unless the next poll will run it anyway."""
+        if not self._initialized:
+            return
+        
+        if not self._update_requested:
+            self._run_update()
+        
+        self.root.after(GUI_UPDATE_INTERVAL_MS, self._heartbeat)
     
     def quit(self) -> None:
         """Quit the GUI application."""